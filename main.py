@@ -1,16 +1,18 @@
 import dataclasses
-import itertools
-import math
-import random
+import functools
+import logging
 import time
 import warnings
 from collections.abc import Sequence
 from typing import Iterable
 
+import numpy as np
 import pyscipopt  # type: ignore
 
+log = logging.getLogger(__name__)
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True, frozen=True)
 class Arc:
     "An undirected arc between nodes `a` and `b`."
     a: int
@@ -20,6 +22,66 @@ class Arc:
         return f"Arc({self.a},{self.b})"
 
 
+class LazyCoverConshdlr(pyscipopt.Conshdlr):
+    """
+    A constraint handler that enforces the vertex cover constraints of the
+    arcs joining `arc_a[k]` and `arc_b[k]` lazily: the constraint
+    `x[a] + x[b] >= 1` is only added to the model once a candidate solution
+    violates it.
+    """
+
+    def __init__(self, x: list[pyscipopt.Variable], arc_a: np.ndarray, arc_b: np.ndarray) -> None:
+        self.x = x
+        self.arc_a = arc_a
+        self.arc_b = arc_b
+        # Whether the constraint of each arc is yet to be added to the model
+        self.pending = np.ones(arc_a.size, dtype=bool)
+        # The nodes that some lazy constraint applies to
+        self.endpoints = np.unique(np.concatenate([arc_a, arc_b])).tolist()
+
+    def violated_arcs(self, solution: pyscipopt.scip.Solution | None) -> np.ndarray:
+        """
+        Return the indices of the pending arcs not covered by `solution`, or
+        by the current LP or pseudo solution if `solution` is `None`.
+        """
+        get_sol_val = self.model.getSolVal
+        values = np.fromiter(
+            (get_sol_val(solution, var) for var in self.x),
+            dtype=np.float64,
+            count=len(self.x)
+        )
+        uncovered = values[self.arc_a] + values[self.arc_b] < 1 - self.model.feastol()
+        return np.flatnonzero(uncovered & self.pending)
+
+    def enforce(self) -> dict:
+        "Add the constraints of the arcs violated by the current solution."
+        violated = self.violated_arcs(None)
+        if not violated.size:
+            return {"result": pyscipopt.SCIP_RESULT.FEASIBLE}
+        for a, b in zip(self.arc_a[violated].tolist(), self.arc_b[violated].tolist()):
+            self.model.addCons(self.x[a] + self.x[b] >= 1)
+        self.pending[violated] = False
+        return {"result": pyscipopt.SCIP_RESULT.CONSADDED}
+
+    def conscheck(self, constraints, solution, checkintegrality, checklprows, printreason,
+                  completely) -> dict:
+        if self.violated_arcs(solution).size:
+            return {"result": pyscipopt.SCIP_RESULT.INFEASIBLE}
+        return {"result": pyscipopt.SCIP_RESULT.FEASIBLE}
+
+    def consenfolp(self, constraints, nusefulconss, solinfeasible) -> dict:
+        return self.enforce()
+
+    def consenfops(self, constraints, nusefulconss, solinfeasible, objinfeasible) -> dict:
+        return self.enforce()
+
+    def conslock(self, constraint, locktype, nlockspos, nlocksneg) -> None:
+        # Rounding an endpoint of a lazy arc down may violate its constraint;
+        # the other variables are free for SCIP's dual reductions
+        for node in self.endpoints:
+            self.model.addVarLocksType(self.x[node], locktype, nlockspos, nlocksneg)
+
+
 class MinimumVertexCoverProblem:
     "An instance of the minimum-weight vertex cover problem."
 
@@ -27,120 +89,410 @@ class MinimumVertexCoverProblem:
     SOLVER_SHOW_OUTPUT = False
     # Time limit on solution time in seconds
     SOLVER_TIME_LIMIT = 600
-
-    def __init__(self, arcs: list[Arc], weights: list[float]) -> None:
+    # Number of threads for SCIP's concurrent solver; 1 solves sequentially.
+    # Only effective if SCIP was built with a task processing interface (TPI)
+    SOLVER_THREADS = 1
+    # Whether to start from the constraints of a spanning forest of the arcs
+    # and add the others lazily, only once a candidate solution violates them.
+    # The lazy constraint handler isn't copied to concurrent solvers, so this
+    # always solves sequentially. It also skips the LP relaxation and the
+    # fixings derived from it, since building the LP would add every arc's
+    # constraint up front anyway
+    SOLVER_LAZY_CONSTRAINTS = False
+    # Whether to run SCIP's presolving, separation and primal heuristics with
+    # aggressive settings. This shrinks the search tree, but the extra work
+    # per node usually costs more time than it saves on small instances
+    SOLVER_AGGRESSIVE = False
+
+    def __init__(
+        self,
+        arcs: list[Arc] | tuple[np.ndarray, np.ndarray],
+        weights: list[float],
+        validate: bool = True
+    ) -> None:
         """
         Initialize an instance of the minimum vertex cover problem.
 
         Parameters
         ----------
-        arcs : list[Arc]
-            A list of Arcs defining the graph. Each endpoint is represented
-            by an integer.
+        arcs : list[Arc] or tuple[np.ndarray, np.ndarray]
+            A list of Arcs defining the graph, or a pair of integer arrays
+            `(arc_a, arc_b)` such that arc `k` joins `arc_a[k]` and `arc_b[k]`.
+            Each endpoint is represented by an integer.
         weights : list[float]
             A list of weights, where `weights[i]` is the weight or cost 
             of including node `i` in the vertex cover.
+        validate : bool
+            Whether to check that every arc joins two valid nodes. Callers
+            that construct the arcs themselves can skip this check.
         """
-        self.arcs = arcs
         self.weights = weights
+        if isinstance(arcs, tuple):
+            arc_a, arc_b = map(np.asarray, arcs)
+        else:
+            arc_a = np.fromiter((arc.a for arc in arcs), dtype=np.int64, count=len(arcs))
+            arc_b = np.fromiter((arc.b for arc in arcs), dtype=np.int64, count=len(arcs))
+        if validate:
+            self.validate_arcs(arc_a, arc_b)
+        # Store the graph as contiguous arrays of endpoints rather than
+        # `Arc` objects, so that the model-building loops and solution checks
+        # can work on whole arrays at once
+        self.arc_a = arc_a.astype(np.int32)
+        self.arc_b = arc_b.astype(np.int32)
+
+        self.kernelize()
 
         self.initialize_solver()
         self.generate_decision_variables()
         self.generate_constraints()
-        self.generate_objective_function()
 
         # Let the user call this (potentially expensive function)
         # self.solve_problem()
 
-    @property
+    @functools.cached_property
     def nodes(self) -> Sequence[int]:
         "Iterator over the node indices."
         return range(len(self.weights))
 
+    @property
+    def arcs(self) -> list[Arc]:
+        "The arcs of the graph, as a list of `Arc`s."
+        return [Arc(a, b) for a, b in zip(self.arc_a.tolist(), self.arc_b.tolist())]
+
+    def validate_arcs(self, arc_a: np.ndarray, arc_b: np.ndarray) -> None:
+        "Raise an error unless `arc_a` and `arc_b` pair up valid nodes."
+        if arc_a.ndim != 1 or arc_a.shape != arc_b.shape:
+            raise ValueError("Arc endpoint arrays must be one-dimensional and of equal length")
+        if arc_a.size and not (
+                np.issubdtype(arc_a.dtype, np.integer) and np.issubdtype(arc_b.dtype, np.integer)):
+            raise ValueError("Arc endpoint arrays must have an integer dtype")
+
+        n_nodes = len(self.weights)
+        for side, endpoints in (("Left", arc_a), ("Right", arc_b)):
+            invalid = np.flatnonzero((endpoints < 0) | (endpoints >= n_nodes))
+            if invalid.size:
+                arc = Arc(int(arc_a[invalid[0]]), int(arc_b[invalid[0]]))
+                raise ValueError(
+                    f"{side} endpoint of arc {arc} is outside the index of `self.weights`")
+
+    def kernelize(self) -> None:
+        """
+        Shrink the problem with reduction rules before the MILP is built.
+
+        Nodes with a self-loop must be in every vertex cover. A node whose
+        only neighbor is no heavier than itself can be swapped for that
+        neighbor in any cover, so the neighbor is included. Nodes that are
+        left without any uncovered arcs are excluded. The rules are applied
+        until none of them fires.
+
+        Populates `self.forced_in`, the nodes known to be in the cover;
+        `self.removed_nodes`, all nodes decided by the rules; and
+        `self.kernel_arc_a` and `self.kernel_arc_b`, the endpoints of the
+        arcs that are still uncovered, with each undirected arc listed once.
+        """
+        neighbors: list[set[int]] = [set() for _ in self.nodes]
+        self.forced_in: set[int] = set()
+        for a, b in zip(self.arc_a.tolist(), self.arc_b.tolist()):
+            if a == b:
+                self.forced_in.add(a)
+            else:
+                neighbors[a].add(b)
+                neighbors[b].add(a)
+
+        self.removed_nodes: set[int] = set()
+        pending = list(self.nodes)
+
+        def remove(node: int) -> None:
+            self.removed_nodes.add(node)
+            for neighbor in neighbors[node]:
+                neighbors[neighbor].discard(node)
+                pending.append(neighbor)
+            neighbors[node].clear()
+
+        for node in self.forced_in:
+            remove(node)
+
+        while pending:
+            node = pending.pop()
+            if node in self.removed_nodes:
+                continue
+            match len(neighbors[node]):
+                case 0:
+                    remove(node)
+                case 1:
+                    (neighbor,) = neighbors[node]
+                    if self.weights[neighbor] <= self.weights[node]:
+                        self.forced_in.add(neighbor)
+                        remove(neighbor)
+
+        is_removed = np.zeros(len(self.nodes), dtype=bool)
+        is_removed[list(self.removed_nodes)] = True
+        in_kernel = ~(is_removed[self.arc_a] | is_removed[self.arc_b])
+        # Orient each remaining arc from its lower to its higher endpoint and
+        # drop repeats, so that each undirected arc yields one constraint
+        low = np.minimum(self.arc_a[in_kernel], self.arc_b[in_kernel]).astype(np.int64)
+        high = np.maximum(self.arc_a[in_kernel], self.arc_b[in_kernel]).astype(np.int64)
+        keys = np.unique((low << 32) | high)
+        self.kernel_arc_a = (keys >> 32).astype(np.int32)
+        self.kernel_arc_b = (keys & 0xFFFFFFFF).astype(np.int32)
+        log.info("Reduced problem: %d of %d nodes fixed", len(self.removed_nodes), len(self.nodes))
+
     def initialize_solver(self) -> None:
         "Initialize the MILP solver."
         self.milp_solver = pyscipopt.Model()
         self.milp_solver.setParam("limits/time", self.SOLVER_TIME_LIMIT)
+        self.milp_solver.setParam("parallel/maxnthreads", self.SOLVER_THREADS)
+        if self.SOLVER_AGGRESSIVE:
+            self.milp_solver.setPresolve(pyscipopt.SCIP_PARAMSETTING.AGGRESSIVE)
+            self.milp_solver.setSeparating(pyscipopt.SCIP_PARAMSETTING.AGGRESSIVE)
+            self.milp_solver.setHeuristics(pyscipopt.SCIP_PARAMSETTING.AGGRESSIVE)
+            # The negated endpoints of each arc form a clique of size 2; let the
+            # set covering constraint handler lift these into larger cliques
+            self.milp_solver.setParam("constraints/setppc/cliquelifting", True)
 
     def generate_decision_variables(self) -> None:
         """
         Generate boolean variables representing whether each node is included 
-        in the optimal solution.
+        in the optimal solution. Variables for nodes removed by `kernelize`
+        are fixed to their known value.
+
+        Each variable's objective coefficient is set to the node's weight as
+        it is created. SCIP minimizes by default, so this also defines the
+        objective function: the sum of the weights of the selected nodes.
         """
-        print("Generating decision variables", end="")
+        # Bind the lookups used for every node to locals
+        add_var = self.milp_solver.addVar
+        forced_in = self.forced_in
+        excluded = self.removed_nodes - self.forced_in
+        weights = self.weights
         self.x: list[pyscipopt.Variable] = [
-            self.milp_solver.addVar(f"x[{node}]", vtype="BINARY")
+            add_var(
+                vtype="BINARY",
+                lb=1 if node in forced_in else 0,
+                ub=0 if node in excluded else 1,
+                obj=weights[node]
+            )
             for node in self.nodes
         ]
-        print(" ... done.")
+        log.info("Generated %d decision variables", len(self.x))
 
     def generate_constraints(self) -> None:
-        "Generate the vertex cover constraints for each node."
-        print("Generating vertex cover constraints", end="")
-        for arc in self.arcs:
-            self._validate_arc(arc)
-            self.milp_solver.addCons(
-                self.x[arc.a] + self.x[arc.b] >= 1,
-                f"Must select at least one endpoint of {arc}"
+        "Generate the vertex cover constraints for each arc left in the kernel."
+        initial_arc_a, initial_arc_b = self.kernel_arc_a, self.kernel_arc_b
+        if self.SOLVER_LAZY_CONSTRAINTS:
+            in_forest = spanning_forest(self.kernel_arc_a, self.kernel_arc_b, len(self.nodes))
+            initial_arc_a = self.kernel_arc_a[in_forest]
+            initial_arc_b = self.kernel_arc_b[in_forest]
+            self.lazy_conshdlr = LazyCoverConshdlr(
+                self.x, self.kernel_arc_a[~in_forest], self.kernel_arc_b[~in_forest])
+            self.milp_solver.includeConshdlr(
+                self.lazy_conshdlr,
+                "lazy_cover",
+                "Adds vertex cover constraints once they are violated",
+                enfopriority=-1,
+                chckpriority=-1,
+                needscons=False
             )
-        print(" ... done.")
-
-    def _validate_arc(self, arc: Arc) -> None:
-        """
-        Raise an error unless both endpoints of the arc are present in
-        the current solution.
-        """
-        if not arc.a in self.nodes:
-            raise ValueError(f"Left endpoint of arc {arc} is outside the index of `self.weights`")
-        if not arc.b in self.nodes:
-            raise ValueError(f"Right endpoint of arc {arc} is outside the index of `self.weights`")
-
-    def generate_objective_function(self) -> None:
-        """
-        Construct the objective function, namely to minimize the sum of the weights
-        of the selected nodes.
-        """
-        print("Generating objective function", end="")
-        self.milp_solver.setObjective(
-            sum(
-                self.weights[node] * self.x[node]
-                for node in self.nodes
-            ),
-            sense="minimize"
-        )
-        print(" ... done.")
+            # Symmetry detection only sees the constraints already in the model,
+            # so it would add symmetry-breaking constraints that are invalid
+            # once the lazy constraints are taken into account
+            self.milp_solver.setParam("misc/usesymmetry", 0)
+        # Hand the whole batch to the solver in a single call. The constraints
+        # are left unnamed (SCIP generates names), which saves formatting a
+        # string for each arc
+        x = self.x
+        self.milp_solver.addConss([
+            x[a] + x[b] >= 1
+            for a, b in zip(initial_arc_a.tolist(), initial_arc_b.tolist())
+        ])
+        log.info("Generated %d vertex cover constraints", initial_arc_a.size)
 
     def solve_problem(self) -> None:
         "Solve the MILP using the backend defined in `self.SOLVER_NAME`."
-        print(f"Solving problem using SCIP backend.")
+        log.info("Solving problem using SCIP backend")
         self.milp_solver.hideOutput(quiet=not self.SOLVER_SHOW_OUTPUT)
-
-        self.milp_solver.optimize()
+        self.lp_values: np.ndarray | None = None
+        # Wall time spent solving the LP relaxation and fixing variables,
+        # which `getSolvingTime` doesn't include
+        self.lp_time = 0.0
+        if not self.SOLVER_LAZY_CONSTRAINTS:
+            then = time.time()
+            self.solve_lp_relaxation()
+            self.fix_integral_lp_values()
+            self.lp_time = time.time() - then
+        self.add_initial_solution()
+
+        if self.SOLVER_THREADS > 1 and not self.SOLVER_LAZY_CONSTRAINTS:
+            self.milp_solver.solveConcurrent()
+        else:
+            self.milp_solver.optimize()
         match self.milp_solver.getStatus():
             case "optimal":
-                print("Optimal solution found.")
+                log.info("Optimal solution found")
+                self.cache_solution()
                 self.validate_solution()
                 self.display_solution()
             case "timelimit":
                 warnings.warn(
                     "Solver timed out on a feasible, but potentially suboptimal solution.")
+                self.cache_solution()
                 self.validate_solution()
                 self.display_solution()
             case "infeasible":
-                print("Problem is infeasible: No vertex covers exist.")
+                log.warning("Problem is infeasible: No vertex covers exist")
             case "unbounded":
                 # How did we get here? All decision variables are bounded,
                 # so the objective value should be finite as long as the vertex
                 # weights are
-                print("Problem is unbounded; are all vertex weights finite?")
+                log.warning("Problem is unbounded; are all vertex weights finite?")
             case _:
-                print(f"Solver failed to converge within {self.SOLVER_TIME_LIMIT = } seconds.")
+                log.warning("Solver failed to converge within %s seconds", self.SOLVER_TIME_LIMIT)
+
+    def greedy_initial_solution(self) -> list[bool]:
+        """
+        Return a vertex cover whose weight is at most twice the optimum, as
+        a list of bools indicating whether each node is included.
+
+        Uses the local-ratio algorithm of Bar-Yehuda and Even: for each arc,
+        subtract the smaller residual weight of its endpoints from both, then
+        take every node whose residual weight has dropped to zero. The nodes
+        whose variables are already fixed, by `kernelize` or by
+        `fix_integral_lp_values`, keep their fixed values, so only the kernel
+        arcs between two unfixed nodes are considered.
+        """
+        fixed_in = [var.getLbOriginal() > 0.5 for var in self.x]
+        fixed_out = [var.getUbOriginal() < 0.5 for var in self.x]
+        residual = list(self.weights)
+        for a, b in zip(self.kernel_arc_a.tolist(), self.kernel_arc_b.tolist()):
+            if fixed_in[a] or fixed_in[b] or fixed_out[a] or fixed_out[b]:
+                # Already covered by a node fixed in the cover; an arc can only
+                # lose an endpoint to an LP value of 0 if the other one has LP
+                # value 1
+                continue
+            delta = min(residual[a], residual[b])
+            residual[a] -= delta
+            residual[b] -= delta
+        return [
+            fixed_in[node] or (not fixed_out[node] and residual[node] <= 0)
+            for node in self.nodes
+        ]
+
+    def solve_lp_relaxation(self) -> None:
+        """
+        Solve the LP relaxation of the problem, in which nodes may be
+        fractionally included, on a separate solver instance. Stores the
+        value of each node's variable in `self.lp_values`, or `None` if no
+        optimal LP solution was found.
+        """
+        lp_solver = pyscipopt.Model()
+        lp_solver.hideOutput()
+        lp_solver.setParam("limits/time", self.SOLVER_TIME_LIMIT)
+        x = [
+            lp_solver.addVar(
+                vtype="CONTINUOUS",
+                lb=var.getLbOriginal(),
+                ub=var.getUbOriginal(),
+                obj=self.weights[node]
+            )
+            for node, var in zip(self.nodes, self.x)
+        ]
+        lp_solver.addConss([
+            x[a] + x[b] >= 1
+            for a, b in zip(self.kernel_arc_a.tolist(), self.kernel_arc_b.tolist())
+        ])
+        lp_solver.optimize()
+
+        if lp_solver.getStatus() == "optimal":
+            self.lp_values = np.fromiter(
+                (lp_solver.getVal(var) for var in x),
+                dtype=np.float64,
+                count=len(x)
+            )
+        else:
+            self.lp_values = None
+        log.info("Solved LP relaxation")
+
+    def fix_integral_lp_values(self) -> None:
+        """
+        Fix each decision variable whose value in the LP relaxation is
+        integral to that value.
+
+        By the Nemhauser-Trotter theorem, some minimum-weight vertex cover
+        includes every node with LP value 1 and excludes every node with LP
+        value 0, so only the fractional nodes are left to branch on.
+        """
+        if self.lp_values is None:
+            return
+        tolerance = self.milp_solver.feastol()
+        n_fixed = 0
+        for node, var, value in zip(self.nodes, self.x, self.lp_values.tolist()):
+            if node in self.removed_nodes:
+                # Already fixed by `kernelize`
+                continue
+            if value <= tolerance:
+                self.milp_solver.chgVarUb(var, 0)
+                n_fixed += 1
+            elif value >= 1 - tolerance:
+                self.milp_solver.chgVarLb(var, 1)
+                n_fixed += 1
+        log.info(
+            "Fixed %d of %d kernel nodes to their LP value",
+            n_fixed, len(self.nodes) - len(self.removed_nodes)
+        )
+
+    def lp_rounding_solution(self) -> list[bool] | None:
+        """
+        Return a vertex cover whose weight is at most twice the optimum, as
+        a list of bools indicating whether each node is included, or `None`
+        if the LP relaxation wasn't solved.
+
+        Includes every node whose LP value is at least 1/2; since the values
+        of the two endpoints of each arc sum to at least 1, this covers
+        every arc.
+        """
+        if self.lp_values is None:
+            return None
+        # Allow for the solver's feasibility tolerance on x[a] + x[b] >= 1
+        return (self.lp_values >= 0.5 - 1e-6).tolist()
+
+    def add_initial_solution(self) -> None:
+        """
+        Give the solver the greedy and LP-rounded vertex covers as starting
+        incumbents, so that it can prune branches worse than the better of
+        the two from the root node.
+        """
+        for cover in (self.greedy_initial_solution(), self.lp_rounding_solution()):
+            if cover is None:
+                continue
+            solution = self.milp_solver.createSol()
+            for var, included in zip(self.x, cover):
+                self.milp_solver.setSolVal(solution, var, float(included))
+            self.milp_solver.addSol(solution)
+
+    def cache_solution(self) -> None:
+        """
+        Read the best solution from the solver once and store which nodes
+        it includes in `self.included`, so that checking and displaying the
+        solution doesn't have to query the solver again for each node or arc.
+        """
+        # `getVal` looks up the best solution again on every call
+        solution = self.milp_solver.getBestSol()
+        get_sol_val = self.milp_solver.getSolVal
+        x_values = np.fromiter(
+            (get_sol_val(solution, var) for var in self.x),
+            dtype=np.float64,
+            count=len(self.x)
+        )
+        # Compare to 0.5 since solver will report convergence even if
+        # x[a, b] == 0.999
+        self.included = x_values > 0.5
 
     def validate_solution(self) -> None:
         "Double check that the current solution is a vertex cover."
-        print("Double-checking that every arc is covered", end="")
-        assert all(map(self.is_arc_covered, self.arcs))
-        print(" ... done.")
+        # Check all the arcs at once on the cached values rather than calling
+        # `is_arc_covered` for each one
+        assert (self.included[self.arc_a] | self.included[self.arc_b]).all()
+        log.info("Double-checked that every arc is covered")
 
     # Not used
     def is_arc_covered_verbose(self, arc: Arc) -> bool:
@@ -171,52 +523,128 @@ class MinimumVertexCoverProblem:
         Return `True` if the decision variable corresponding to this node has 
         an objective value of 1, `False` if 0.
         """
-        # Compare to 0.5 since solver will report convergence even if
-        # x[a, b] == 0.999
-        return self.milp_solver.getVal(self.x[node]) > 0.5
+        return bool(self.included[node])
 
     def display_solution(self) -> None:
         "Summarize the current solution."
-        included_nodes = list(filter(self.is_node_included, self.nodes))
-        weight = sum(self.weights[a] for a in included_nodes)
+        included_nodes = np.flatnonzero(self.included)
+        weight = float(np.asarray(self.weights)[included_nodes].sum())
         print(
             f"Solution has weight {'%.3f' % weight} and consists of the following {len(included_nodes)} nodes:")
-        print(included_nodes)
+        print(included_nodes.tolist())
 
 
-def randexp() -> float:
-    "A random draw from the standard exponential distribution."
-    return -math.log(random.random())
-
-
-def create_random_instance(density: float, n_nodes: int) -> tuple[list[Arc], list[float]]:
+def spanning_forest(arc_a: np.ndarray, arc_b: np.ndarray, n_nodes: int) -> np.ndarray:
+    """
+    Return a boolean mask selecting a subset of the arcs joining `arc_a[k]`
+    and `arc_b[k]` that forms a spanning forest of the graph.
+    """
+    parent = list(range(n_nodes))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    in_forest = np.zeros(arc_a.size, dtype=bool)
+    for k, (a, b) in enumerate(zip(arc_a.tolist(), arc_b.tolist())):
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_a] = root_b
+            in_forest[k] = True
+    return in_forest
+
+
+def sample_arcs(
+    density: float,
+    n_nodes: int,
+    rng: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the endpoints `(arc_a, arc_b)`, with `arc_a < arc_b`, of a random
+    graph on `n_nodes` nodes in which each of the possible arcs appears
+    independently with probability `density`.
+
+    Rather than drawing a uniform number for every pair of nodes, this draws
+    the geometrically distributed gaps between consecutive arcs in the
+    row-major order of the upper triangle, so that the time and memory used
+    are proportional to the number of arcs rather than to `n_nodes ** 2`.
+    """
+    n_pairs = n_nodes * (n_nodes - 1) // 2
+    if density <= 0 or n_pairs == 0:
+        index = np.empty(0, dtype=np.int64)
+    elif density >= 1:
+        index = np.arange(n_pairs, dtype=np.int64)
+    else:
+        # Draw somewhat more gaps than the expected number of arcs at a time,
+        # so that one batch almost always reaches the end of the triangle
+        expected = n_pairs * density
+        batch_size = int(expected + 4 * np.sqrt(expected)) + 16
+        batches = []
+        position = -1
+        while position < n_pairs:
+            batch = position + np.cumsum(rng.geometric(density, size=batch_size))
+            batches.append(batch)
+            position = batch[-1]
+        index = np.concatenate(batches)
+        index = index[index < n_pairs]
+
+    # Row `a` of the triangle starts at index `a * (2 * n_nodes - a - 1) / 2`;
+    # invert this to recover the endpoints, correcting for rounding error in
+    # the square root
+    def row_start(a: np.ndarray) -> np.ndarray:
+        return a * (2 * n_nodes - a - 1) // 2
+
+    arc_a = ((2 * n_nodes - 1 - np.sqrt((2 * n_nodes - 1) ** 2 - 8 * index)) // 2).astype(np.int64)
+    arc_a -= row_start(arc_a) > index
+    arc_a += row_start(arc_a + 1) <= index
+    arc_b = index - row_start(arc_a) + arc_a + 1
+    return arc_a, arc_b
+
+
+def create_random_instance(
+    density: float,
+    n_nodes: int,
+    *,
+    sort_weights: bool = False,
+    rng: np.random.Generator | int | None = None
+) -> tuple[tuple[np.ndarray, np.ndarray], list[float]]:
     """
     Construct random `arcs` and `weights` to define a random instance
     of the minimum-weight vertex cover problem on a graph with `n_nodes`
     nodes. The node weights are drawn from a standard exponential distribution.
     The arcs are selected randomly from the set of possible arcs; each arc 
-    appears with probability `density`.
+    appears with probability `density`. Since the arcs are undirected, only
+    pairs `a < b` are considered, so there are no duplicate arcs or self-loops.
+    The arcs are returned as a tuple `(arc_a, arc_b)` of endpoint arrays,
+    which `MinimumVertexCoverProblem` accepts without building an `Arc` for
+    each one.
+
+    If `sort_weights` is true, the weights are sorted in ascending order.
+    `rng` is a NumPy random generator, or a seed to create one with; pass
+    the same seed to reproduce an instance.
     """
-    weights = [randexp() for _ in range(n_nodes)]
+    rng = np.random.default_rng(rng)
+    weights = rng.exponential(size=n_nodes)
 
-    # Sort the weights in ascending order. Because the arcs are generated
-    # independently, this has no effect on the difficulty of the problem,
-    # but it interesting to inspect the optimal solution and see whether
-    # most of the selected nodes are those with low indices (i.e. low weights)
-    weights.sort()
+    if sort_weights:
+        # Because the arcs are generated independently, this has no effect on
+        # the difficulty of the problem, but it interesting to inspect the
+        # optimal solution and see whether most of the selected nodes are
+        # those with low indices (i.e. low weights)
+        weights.sort()
 
-    arcs = [
-        Arc(a, b)
-        for a, b in itertools.product(range(n_nodes), repeat=2)
-        if random.random() < density
-    ]
+    arcs = sample_arcs(density, n_nodes, rng)
 
-    return arcs, weights
+    return arcs, weights.tolist()
 
 
 if __name__ == "__main__":
     import sys
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     density = 0.80
     if len(sys.argv) > 1:
         density = float(sys.argv[1])
@@ -225,15 +653,21 @@ if __name__ == "__main__":
     if len(sys.argv) > 2:
         n_nodes = int(sys.argv[2])
 
-    arcs, weights = create_random_instance(density, n_nodes)
+    seed = None
+    if len(sys.argv) > 3:
+        seed = int(sys.argv[3])
+
+    arcs, weights = create_random_instance(density, n_nodes, rng=seed)
 
     then = time.time()
-    problem = MinimumVertexCoverProblem(arcs, weights)
+    # The generated arcs are valid by construction
+    problem = MinimumVertexCoverProblem(arcs, weights, validate=False)
     compilation_time = time.time() - then
 
     problem.solve_problem()
     solver_time = problem.milp_solver.getSolvingTime() / 1000.0
 
-    print(f"Problem size:               {len(problem.nodes)} nodes, {len(problem.arcs)} arcs")
+    print(f"Problem size:               {len(problem.nodes)} nodes, {len(problem.arc_a)} arcs")
     print(f"Problem compilation time:   {'%.3f' % compilation_time} seconds")
+    print(f"LP relaxation time:         {'%.3f' % problem.lp_time} seconds")
     print(f"Problem solution time:      {'%.3f' % solver_time} seconds")